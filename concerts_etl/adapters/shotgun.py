@@ -1,19 +1,23 @@
 # concerts_etl/adapters/shotgun.py
 from __future__ import annotations
 
+import os
 import re
+import time
 import uuid
 import hashlib
 import logging
+import asyncio
+import functools
 import unicodedata
+import contextlib
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from tenacity import retry, wait_exponential, stop_after_attempt
 from playwright.async_api import async_playwright
 
-import dateparser
-
 from concerts_etl.core.models import NormalizedEvent
 from concerts_etl.core.config import settings
 
@@ -22,37 +26,207 @@ log = logging.getLogger(__name__)
 LOGIN_URL = "https://smartboard.shotgun.live/fr/login?destination=%2Fevents"
 EVENTS_URL = "https://smartboard.shotgun.live/events"
 
+# Libellés/URL attendus pendant le login (compilés une fois pour toutes)
+_RE_COOKIE = re.compile(r"(Accepter|Tout accepter|J.?accepte|Accept)", re.I)
+_RE_EMAIL_BTN = re.compile(r"(e.?mail|email)", re.I)
+_RE_TAB_PUBLIE = re.compile(r"publié", re.I)
+_RE_EVENTS_URL = re.compile(r".*/events.*")
+
+# Ressources inutiles au scraping (on ne lit que le DOM). Les CSS restent : innerText en dépend.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net", "hotjar.com", "facebook.net")
+
+# Sélecteurs de cartes (plusieurs variantes, dédupliquées par début d'outerHTML)
+_CARD_SELECTORS = [
+    "div.relative.flex.h-full.w-full.flex-col",                  # vu dans tes dumps
+    "[class*='relative'][class*='flex'][class*='flex-col']",     # fallback large
+    "[data-testid='event-card']",
+    ".ant-card",                                                 # Ant Design card fallback
+]
+
+# Collecte + lecture de toutes les cartes côté navigateur : un seul page.evaluate
+# au lieu d'une dizaine d'allers-retours CDP (query_selector/inner_text) par carte.
+_CARDS_JS = """
+(selectors) => {
+  const txt = (el) => (el ? (el.innerText || "").trim() : null);
+  const cards = [];
+  const seen = new Set();
+  for (const sel of selectors) {
+    let found = [];
+    try { found = document.querySelectorAll(sel); } catch (e) { continue; }
+    for (const c of found) {
+      const key = c.outerHTML.slice(0, 512);
+      if (!seen.has(key)) { seen.add(key); cards.push(c); }
+    }
+  }
+
+  // Fallback ultime : reconstruire par liens plausibles (remonte vers un parent "carte")
+  if (!cards.length) {
+    for (const a of document.querySelectorAll("a[href*='/events/']")) {
+      let n = a, card = null;
+      for (let i = 0; i < 10 && n; i++) {
+        if (n.matches && (
+          n.matches("div.relative.flex.h-full.w-full.flex-col") ||
+          n.matches("[data-testid='event-card']") ||
+          n.matches(".ant-card") ||
+          n.matches("li") || n.matches("div")
+        )) { card = n; break; }
+        n = n.parentElement;
+      }
+      cards.push(card || a.parentElement || a);
+    }
+  }
+
+  return cards.map((c) => {
+    const nameEl = c.querySelector("span.truncate.text-sm.font-medium")
+      || c.querySelector("span.font-medium, h3, a[title], [class*='font-medium']");
+    const timeEl = c.querySelector("time[datetime]");
+    const text = c.innerText || "";
+    return {
+      name: txt(nameEl) || txt(c.querySelector("a")) || null,
+      artist_hint: txt(c.querySelector("[data-testid='artist-name'], .artist-name, .text-artist")),
+      venue_hint: txt(c.querySelector("[data-testid='venue-name'], .venue-name, .text-venue")),
+      city: txt(c.querySelector("[data-testid='city-name'], .text-city, [class*='city']")),
+      dt_iso: timeEl ? timeEl.getAttribute("datetime") : null,
+      dt_text: txt(c.querySelector(
+        "span.text-white-700.text-xs.font-normal, time, [data-testid='event-date'], [class*='text-xs']"
+      )),
+      value_texts: [...c.querySelectorAll(".ant-statistic-content .ant-statistic-content-value")]
+        .map((e) => (e.innerText || "").trim()),
+      suffix_texts: [...c.querySelectorAll(".ant-statistic-content .ant-statistic-content-suffix")]
+        .map((e) => (e.innerText || "").toLowerCase().trim()),
+      pct_text: txt(c.querySelector("span.text-xs.font-semibold, [class*='font-semibold']")),
+      text: text,
+      sold_out: text.toUpperCase().includes("COMPLET"),
+    };
+  });
+}
+"""
+
 
 # ------------------ Utils parsing/texte ------------------
 
-def _strip_accents(s: str) -> str:
-    return "".join(
-        c for c in unicodedata.normalize("NFKD", s) if not unicodedata.combining(c)
-    )
+# "1 234,50 €" → "1234.50" en une passe : séparateurs de milliers supprimés, virgule décimale → point
+_MONEY_STRIP = str.maketrans({"€": None, "\u00a0": None, "\u202f": None, " ": None, ".": None, ",": "."})
+_MONEY_RE = re.compile(r"-?\d+(?:\.\d+)?")
+_INT_RE = re.compile(r"\d+")
+_NONALNUM_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+# Latin-1 Supplement + Latin Extended-A → ASCII, précalculé avec la même règle que le
+# chemin NFKD/ascii-ignore de _slug (les IDs stables restent identiques)
+_LATIN_TO_ASCII = str.maketrans({
+    chr(cp): unicodedata.normalize("NFKD", chr(cp)).encode("ascii", "ignore").decode() or None
+    for cp in range(0xC0, 0x180)
+})
+_WS_RE = re.compile(r"\s+")
+_ARTIST_VENUE_SEPS = ("@", "-", "–", "—")
+_ARTIST_VENUE_RE = re.compile(r"\s*(.+?)\s*(?:@|-|–|—)\s*(.+)\s*$", re.IGNORECASE)
+_ISO_PREFIX_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T")
+_ISO_IN_TEXT_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(?::\d{2})?)")
+_FR_DATE_IN_TEXT_RE = re.compile(
+    r"(?:(?:lun|mar|mer|jeu|ven|sam|dim)\.?\s*)?"
+    r"(\d{1,2}\s+[A-Za-zéûîôàç\.]+\.?\s+\d{4}(?:\s+\d{1,2}:\d{2})?)",
+    re.IGNORECASE,
+)
 
 def _parse_money(text: str) -> Tuple[Optional[float], Optional[str]]:
     if not text:
         return None, None
-    t = text.replace("€", "").replace("\u00a0", "").replace("\u202f", "").replace(" ", "")
-    t = t.replace(".", "").replace(",", ".")
-    m = re.findall(r"-?\d+(?:\.\d+)?", t)
-    return (float(m[0]), "EUR") if m else (None, "EUR")
+    t = text.translate(_MONEY_STRIP)
+    m = _MONEY_RE.search(t)
+    return (float(m.group(0)), "EUR") if m else (None, "EUR")
 
 def _parse_int(text: str) -> Optional[int]:
     if not text:
         return None
-    m = re.findall(r"\d+", text.replace("\u00a0", " ").replace("\u202f", " "))
-    return int(m[0]) if m else None
+    # seul le premier nombre nous intéresse (les espaces insécables ne sont pas des chiffres)
+    m = _INT_RE.search(text)
+    return int(m.group(0)) if m else None
 
+@functools.lru_cache(maxsize=4096)
 def _slug(s: str) -> str:
-    s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode()
-    return re.sub(r"[^a-zA-Z0-9]+", "-", s).strip("-").lower()
+    if not s.isascii():
+        s = s.translate(_LATIN_TO_ASCII)
+        if not s.isascii():  # hors Latin-1/Latin Extended-A : chemin NFKD générique
+            s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode()
+    return _NONALNUM_RE.sub("-", s).strip("-").lower()
 
+@functools.lru_cache(maxsize=4096)
 def _stable_event_id(name: str, dt_key: Optional[str]) -> str:
     base = _slug(name or "event")
     key = f"{base}|{dt_key or ''}"
     return f"{base}-{hashlib.sha1(key.encode()).hexdigest()[:8]}"
 
+@functools.cache
+def _iso_parser():
+    # import paresseux : `import dateparser` compile des milliers de regex (~200 ms)
+    from dateparser.date import DateDataParser
+    return DateDataParser(settings={"RETURN_AS_TIMEZONE_AWARE": False})
+
+_FR_SETTINGS = {
+    "TIMEZONE": "Europe/Paris",
+    "RETURN_AS_TIMEZONE_AWARE": False,
+    "PREFER_DATES_FROM": "future",
+}
+
+@functools.cache
+def _fr_parser():
+    from dateparser.date import DateDataParser
+    return DateDataParser(languages=["fr"], settings=_FR_SETTINGS)
+
+# Les libellés de date se répètent beaucoup d'une carte à l'autre : on mémoïse sur la chaîne brute
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_naive(iso_text: str) -> Optional[datetime]:
+    # RFC3339 (attribut <time datetime>) : la stdlib suffit, dateparser seulement en secours
+    try:
+        return datetime.fromisoformat(iso_text.replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        return _iso_parser().get_date_data(iso_text).date_obj
+
+# Formats Shotgun usuels ("sam. 12 avr. 2025 20:00", "12 avril 2025 à 20h30") : parse direct
+_FR_MONTHS = {
+    "janvier": 1, "janv": 1, "jan": 1,
+    "février": 2, "fevrier": 2, "févr": 2, "fevr": 2, "fév": 2, "fev": 2,
+    "mars": 3,
+    "avril": 4, "avr": 4,
+    "mai": 5,
+    "juin": 6,
+    "juillet": 7, "juil": 7,
+    "août": 8, "aout": 8,
+    "septembre": 9, "sept": 9, "sep": 9,
+    "octobre": 10, "oct": 10,
+    "novembre": 11, "nov": 11,
+    "décembre": 12, "decembre": 12, "déc": 12, "dec": 12,
+}
+_FR_SIMPLE_DT_RE = re.compile(
+    r"\s*(?:(?:lun|mar|mer|jeu|ven|sam|dim)[a-z]*\.?,?\s+)?"
+    r"(\d{1,2})(?:er)?\s+([^\W\d_]+)\.?\s+(\d{4})"
+    r"(?:\s*(?:,|à|-)?\s*(\d{1,2})\s*[:h]\s*(\d{2}))?\s*",
+    re.IGNORECASE,
+)
+
+# seul le chemin direct (dates absolues) est mémoïsé
+@functools.lru_cache(maxsize=4096)
+def _parse_fr_simple(dt_text: str) -> Optional[datetime]:
+    m = _FR_SIMPLE_DT_RE.fullmatch(dt_text)
+    if m:
+        month = _FR_MONTHS.get(m.group(2).lower())
+        if month:
+            try:
+                return datetime(int(m.group(3)), month, int(m.group(1)),
+                                int(m.group(4) or 0), int(m.group(5) or 0))
+            except ValueError:
+                pass
+    return None
+
+def _parse_fr_text(dt_text: str) -> Optional[datetime]:
+    dt = _parse_fr_simple(dt_text)
+    if dt:
+        return dt
+    # formats inattendus / relatifs ("demain 20:00", "ce soir") → dateparser, non mis en cache :
+    # le résultat dépend du jour courant et le process (POOL) peut vivre plusieurs jours
+    return _fr_parser().get_date_data(dt_text).date_obj
+
 def _parse_fr_datetime(dt_text: Optional[str]) -> Optional[datetime]:
     """
     Parse FR, renvoie un datetime NAIF (local Europe/Paris) pour coller à timezone="Europe/Paris".
@@ -64,24 +238,15 @@ def _parse_fr_datetime(dt_text: Optional[str]) -> Optional[datetime]:
     # Direct ISO → essaye d'abord
     iso_try = dt_text.strip()
     try:
-        if re.match(r"^\d{4}-\d{2}-\d{2}T", iso_try):
-            dt = dateparser.parse(iso_try, settings={"RETURN_AS_TIMEZONE_AWARE": False})
+        if _ISO_PREFIX_RE.match(iso_try):
+            dt = _parse_iso_naive(iso_try)
             if dt:
                 return dt
     except Exception:
         pass
 
     # Phrases FR
-    dt = dateparser.parse(
-        dt_text,
-        languages=["fr"],
-        settings={
-            "TIMEZONE": "Europe/Paris",
-            "RETURN_AS_TIMEZONE_AWARE": False,
-            "PREFER_DATES_FROM": "future",
-        },
-    )
-    return dt
+    return _parse_fr_text(dt_text)
 
 def _guess_artist_and_venue(event_name: str, artist_hint: Optional[str] = None, venue_hint: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
     """
@@ -93,8 +258,9 @@ def _guess_artist_and_venue(event_name: str, artist_hint: Optional[str] = None,
     artist = (artist_hint or "").strip() or None
     venue = (venue_hint or "").strip() or None
 
-    if not artist or not venue:
-        m = re.match(r"\s*(.+?)\s*(?:@|-|–|—)\s*(.+)\s*$", event_name or "", flags=re.IGNORECASE)
+    # sans aucun séparateur la regex ne peut pas matcher : on évite son backtracking
+    if (not artist or not venue) and any(sep in (event_name or "") for sep in _ARTIST_VENUE_SEPS):
+        m = _ARTIST_VENUE_RE.match(event_name or "")
         if m:
             artist = artist or m.group(1).strip()
             venue = venue or m.group(2).strip()
@@ -104,81 +270,336 @@ def _guess_artist_and_venue(event_name: str, artist_hint: Optional[str] = None,
 
     # nettoyage soft
     if artist:
-        artist = re.sub(r"\s+", " ", artist)
+        artist = _WS_RE.sub(" ", artist)
     if venue:
-        venue = re.sub(r"\s+", " ", venue)
+        venue = _WS_RE.sub(" ", venue)
 
     return artist, venue
 
 
-# ------------------ Scraper principal ------------------
-
-@retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3))
-async def run() -> List[NormalizedEvent]:
-    run_id = str(uuid.uuid4())
-    now = datetime.now(timezone.utc)
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=["--disable-blink-features=AutomationControlled"]
-        )
-        context = await browser.new_context(
-            locale="fr-FR",
-            timezone_id="Europe/Paris",
-            user_agent="Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36"
-        )
-        page = await context.new_page()
+# ------------------ Cartes : texte brut → NormalizedEvent ------------------
+
+@dataclass(slots=True)
+class CardRaw:
+    """Champs texte d'une carte, tels que renvoyés par _CARDS_JS (aucun parsing)."""
+    name: Optional[str] = None
+    artist_hint: Optional[str] = None
+    venue_hint: Optional[str] = None
+    city: Optional[str] = None
+    dt_iso: Optional[str] = None
+    dt_text: Optional[str] = None
+    value_texts: List[str] = field(default_factory=list)
+    suffix_texts: List[str] = field(default_factory=list)
+    pct_text: Optional[str] = None
+    text: str = ""
+    sold_out: bool = False
+
+
+def _card_to_event(card: CardRaw, now: datetime, run_id: str) -> Optional[NormalizedEvent]:
+    """Construit un NormalizedEvent à partir d'une carte brute (None si sans nom)."""
+    # --- Nom de l'événement
+    event_name = card.name
+    if not event_name:
+        return None  # sans nom, on passe
+
+    # --- Artiste/lieu hints si présents
+    city = card.city
+    artist_name, venue_name = _guess_artist_and_venue(
+        event_name,
+        artist_hint=card.artist_hint,
+        venue_hint=card.venue_hint or city,
+    )
 
-        # ---------- LOGIN ----------
-        await page.goto(LOGIN_URL, wait_until="domcontentloaded")
+    # --- Date/heure locale (bétonnée) ---
+    event_dt = None
+    raw = card.text or ""
 
-        # cookies
+    # 1) Balise <time datetime="...">
+    iso_val = card.dt_iso
+    if iso_val:
         try:
-            btn = page.get_by_role("button", name=re.compile(r"(Accepter|Tout accepter|J.?accepte|Accept)", re.I)).first
-            if await btn.is_visible(timeout=2000):
-                await btn.click()
+            event_dt = _parse_iso_naive(iso_val)
         except Exception:
-            pass
+            event_dt = None
+
+    # 2) Fallback: texte voisin (petit libellé date)
+    if event_dt is None:
+        dt_text = card.dt_text
+        if dt_text:
+            event_dt = _parse_fr_text(dt_text)
 
-        # "se connecter par e-mail"
+    # 3) Fallback ultime: on racle tout le texte de la carte et on cherche:
+    #    - un ISO (2025-11-29T19:00)
+    #    - ou un motif FR "ven. 10 oct. 2025 19:30" / "10 oct. 2025 19:30" / "10 octobre 2025 19:30"
+    if event_dt is None:
         try:
-            trigger = page.get_by_role("button", name=re.compile(r"(e.?mail|email)", re.I)).first
-            if await trigger.is_visible(timeout=2000):
-                await trigger.click()
+            # ISO
+            m = _ISO_IN_TEXT_RE.search(raw)
+            if m:
+                event_dt = _parse_iso_naive(m.group(1))
+            if event_dt is None:
+                # FR courte (avec mois abrégé) ou longue
+                m = _FR_DATE_IN_TEXT_RE.search(raw)
+                if m:
+                    event_dt = _parse_fr_text(m.group(1))
         except Exception:
             pass
 
-        # credentials
-        email_input = page.locator('input[type="email"]').first
-        pwd_input = page.locator('input[type="password"]').first
-        await email_input.fill(settings.shotgun_email)
-        await pwd_input.fill(settings.shotgun_password)
+    # 4) Si on n'a toujours rien, trace courte pour debug
+    if event_dt is None:
+        log.debug("Shotgun: date introuvable pour %r ; snippet=%r", event_name, raw[:200].replace("\n", " "))
 
-        submit = page.locator('button[type="submit"]').first
-        try:
-            await email_input.press("Tab")
-            await pwd_input.press("Tab")
-        except Exception:
-            pass
+    # --- Statistiques (€, #, %) ---
+    gross_total = None
+    tickets_total = None
+    sell_through_pct = None
 
-        try:
-            await submit.wait_for(state="enabled", timeout=8000)
-            await submit.click()
-        except Exception:
-            await pwd_input.press("Enter")
+    try:
+        # value[i] ↔ suffix[i] si dispo ; une seule passe, en ignorant les stats "aujourd'hui" :
+        # premier entier lisible → billets, premier montant € → CA
+        suffix_texts = card.suffix_texts
+        n_suf = len(suffix_texts)
+        gross_found = False
+        for i, txt in enumerate(card.value_texts):
+            if i < n_suf and "aujourd" in suffix_texts[i]:
+                continue
+            if tickets_total is None:
+                tickets_total = _parse_int(txt)
+            if not gross_found and "€" in txt:
+                gross_total, _ = _parse_money(txt)
+                gross_found = True
+            if gross_found and tickets_total is not None:
+                break
+
+        # % (si présent quelque part)
+        pct_txt = card.pct_text
+        if pct_txt is not None:
+            sell_through_pct = float(_parse_int(pct_txt) or 0)
 
-        # ---------- EVENTS ----------
-        try:
-            await page.wait_for_url(re.compile(r".*/events.*"), timeout=45000)
-        except Exception:
+    except Exception:
+        pass
+
+    # --- Statut
+    status = "sold out" if card.sold_out else "on sale"
+
+    # --- ID stable
+    dt_key = event_dt.isoformat() if event_dt else None
+    event_id_provider = _stable_event_id(event_name, dt_key)
+
+    # champs déjà typés ci-dessus (str/float/int/datetime naïf) : pas de revalidation pydantic
+    return NormalizedEvent.model_construct(
+        provider="shotgun",
+        event_id_provider=event_id_provider,
+        event_name=event_name,
+        city=city,
+        country=None,
+        event_datetime_local=event_dt,  # NAIF local
+        timezone="Europe/Paris",
+        status=status,
+        tickets_sold_total=tickets_total,
+        gross_total=gross_total,
+        net_total=None,
+        currency="EUR",
+        sell_through_pct=sell_through_pct,
+        scrape_ts_utc=now,
+        ingestion_run_id=run_id,
+        artist_name=artist_name,
+        venue_name=venue_name or city,
+    )
+
+
+def normalize(cards: List[CardRaw], now: datetime, run_id: str) -> List[NormalizedEvent]:
+    """Phase CPU pure (aucun await) : parse les cartes brutes en NormalizedEvent."""
+    out: List[NormalizedEvent] = []
+    for card in cards:
+        ev = _card_to_event(card, now, run_id)
+        if ev:
+            out.append(ev)
+    return out
+
+
+# ------------------ Scraper principal ------------------
+
+class BrowserPool:
+    """Un seul Chromium par process, démarré à la demande ; un contexte neuf par acquire().
+
+    Les retries tenacity et les runs successifs dans le même process ne repaient
+    plus le lancement du navigateur. Le nombre de contextes simultanés est borné.
+    """
+
+    def __init__(self, max_contexts: int = 3) -> None:
+        self._sem = asyncio.Semaphore(max_contexts)
+        self._lock = asyncio.Lock()
+        self._pw = None
+        self._browser = None
+
+    async def _get_browser(self):
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._pw is None:
+                    self._pw = await async_playwright().start()
+                self._browser = await self._pw.chromium.launch(
+                    headless=True,
+                    args=["--disable-blink-features=AutomationControlled"]
+                )
+            return self._browser
+
+    @contextlib.asynccontextmanager
+    async def acquire(self, storage_state: Optional[str] = None) -> AsyncIterator[Any]:
+        async with self._sem:
+            browser = await self._get_browser()
+            context = await browser.new_context(
+                locale="fr-FR",
+                timezone_id="Europe/Paris",
+                user_agent="Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
+                storage_state=storage_state,
+            )
+            try:
+                yield context
+            finally:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._browser is not None:
+                try:
+                    await self._browser.close()
+                except Exception:
+                    pass
+                self._browser = None
+            if self._pw is not None:
+                try:
+                    await self._pw.stop()
+                except Exception:
+                    pass
+                finally:
+                    self._pw = None
+
+
+POOL = BrowserPool()
+
+
+async def close_browser() -> None:
+    """À appeler par le driver ETL en fin de run."""
+    await POOL.close()
+
+
+def _state_is_fresh(path: str) -> bool:
+    """Session sauvegardée présente et plus récente que SHOTGUN_STATE_MAX_AGE_H."""
+    try:
+        age_s = time.time() - os.path.getmtime(path)
+    except OSError:
+        return False
+    return age_s < settings.shotgun_state_max_age_h * 3600
+
+
+async def _block_heavy_resources(route) -> None:
+    req = route.request
+    if req.resource_type in _BLOCKED_RESOURCE_TYPES or any(h in req.url for h in _BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _collect_cards(page) -> List[CardRaw]:
+    """Phase I/O : toutes les cartes de la page courante en un seul aller-retour CDP."""
+    raw_cards: List[Dict[str, Any]] = await page.evaluate(_CARDS_JS, _CARD_SELECTORS)
+    return [CardRaw(**d) for d in raw_cards]
+
+
+async def _login(page) -> bool:
+    """Login e-mail/mot de passe ; True si on a bien été redirigé vers /events."""
+    await page.goto(LOGIN_URL, wait_until="domcontentloaded")
+
+    # cookies
+    try:
+        btn = page.get_by_role("button", name=_RE_COOKIE).first
+        if await btn.is_visible(timeout=2000):
+            await btn.click()
+    except Exception:
+        pass
+
+    # "se connecter par e-mail"
+    try:
+        trigger = page.get_by_role("button", name=_RE_EMAIL_BTN).first
+        if await trigger.is_visible(timeout=2000):
+            await trigger.click()
+    except Exception:
+        pass
+
+    # credentials
+    email_input = page.locator('input[type="email"]').first
+    pwd_input = page.locator('input[type="password"]').first
+    await email_input.fill(settings.shotgun_email)
+    await pwd_input.fill(settings.shotgun_password)
+
+    submit = page.locator('button[type="submit"]').first
+    try:
+        await email_input.press("Tab")
+        await pwd_input.press("Tab")
+    except Exception:
+        pass
+
+    try:
+        await submit.wait_for(state="enabled", timeout=8000)
+        await submit.click()
+    except Exception:
+        await pwd_input.press("Enter")
+
+    try:
+        await page.wait_for_url(_RE_EVENTS_URL, timeout=45000)
+    except Exception:
+        return False
+    return True
+
+
+@retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3))
+async def run() -> List[NormalizedEvent]:
+    run_id = str(uuid.uuid4())
+    now = datetime.now(timezone.utc)
+
+    state_path = settings.shotgun_state_path
+    has_state = bool(state_path) and _state_is_fresh(state_path)
+
+    async with POOL.acquire(storage_state=state_path if has_state else None) as context:
+        await context.route("**/*", _block_heavy_resources)
+        page = await context.new_page()
+
+        # Debug : on note les appels XHR JSON du smartboard (repérage de l'API interne)
+        xhr_seen: List[str] = []
+        if settings.debug_dumps:
+            def _on_response(resp) -> None:
+                if "json" in (resp.headers.get("content-type") or ""):
+                    xhr_seen.append(f"{resp.status} {resp.request.method} {resp.url}")
+            page.on("response", _on_response)
+
+        # ---------- SESSION / LOGIN ----------
+        # Session sauvegardée (cookies/localStorage) → on tente /events directement
+        logged_in = False
+        if has_state:
             await page.goto(EVENTS_URL, wait_until="domcontentloaded")
+            logged_in = "/login" not in page.url
+            if not logged_in:
+                log.info("Shotgun: session sauvegardée expirée, login complet")
+
+        if not logged_in:
+            if await _login(page) and state_path:
+                try:
+                    await context.storage_state(path=state_path)
+                except Exception:
+                    log.warning("Shotgun: impossible de sauvegarder la session dans %s", state_path)
 
-        await page.goto(EVENTS_URL, wait_until="domcontentloaded")
+        # ---------- EVENTS ----------
+        # On ne renavigue que si on n'est pas déjà posé sur /events
+        if not page.url.startswith(EVENTS_URL):
+            await page.goto(EVENTS_URL, wait_until="domcontentloaded")
 
         # Onglet "Publié" si présent
         try:
-            tab_publie = page.get_by_role("tab", name=re.compile(r"publié", re.I))
+            tab_publie = page.get_by_role("tab", name=_RE_TAB_PUBLIE)
             if await tab_publie.is_visible(timeout=2000):
                 await tab_publie.click()
         except Exception:
@@ -195,70 +616,37 @@ async def run() -> List[NormalizedEvent]:
 
         # Scroll pour charger (infini “soft”)
         async def auto_scroll():
+            # lecture de hauteur + scroll dans le même evaluate : 1 aller-retour CDP par itération
             prev = 0
             for _ in range(12):
-                await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
-                await page.wait_for_timeout(700)
-                height = await page.evaluate("document.body.scrollHeight")
+                height = await page.evaluate(
+                    "() => { const h = document.body.scrollHeight; window.scrollBy(0, h); return h; }"
+                )
                 if height == prev:
                     break
                 prev = height
+                await page.wait_for_timeout(700)
 
         await auto_scroll()
 
-        # Récupération des cartes (plusieurs variantes)
-        selectors = [
-            "div.relative.flex.h-full.w-full.flex-col",                  # vu dans tes dumps
-            "[class*='relative'][class*='flex'][class*='flex-col']",     # fallback large
-            "[data-testid='event-card']",
-            ".ant-card",                                                 # Ant Design card fallback
-        ]
-        cards = []
-        used = set()
-        for sel in selectors:
-            try:
-                found = await page.query_selector_all(sel)
-                for c in found:
-                    try:
-                        outer = await c.evaluate("e => e.outerHTML.slice(0, 512)")
-                        h = hash(outer)
-                        if h not in used:
-                            used.add(h)
-                            cards.append(c)
-                    except Exception:
-                        cards.append(c)
-            except Exception:
-                continue
-
-        # Fallback ultime : reconstruire par liens plausibles
-        if not cards:
-            try:
-                links = await page.query_selector_all("a[href*='/events/']")
-                for a in links:
-                    # remonte vers un parent “carte”
-                    card_handle = await a.evaluate_handle("""
-                        (el) => {
-                          let n = el;
-                          for (let i=0; i<10 && n; i++) {
-                            if (n.matches && (
-                              n.matches("div.relative.flex.h-full.w-full.flex-col") ||
-                              n.matches("[data-testid='event-card']") ||
-                              n.matches(".ant-card") ||
-                              n.matches("li") || n.matches("div")
-                            )) return n;
-                            n = n.parentElement;
-                          }
-                          return el.parentElement || el;
-                        }
-                    """)
-                    ce = card_handle.as_element()
-                    if ce:
-                        cards.append(ce)
-            except Exception:
-                pass
+        # Récupération + extraction des cartes en un seul aller-retour CDP
+        try:
+            cards = await _collect_cards(page)
+        except Exception:
+            log.exception("Shotgun: extraction des cartes impossible")
+            cards = []
 
         # Debug si rien
         if not cards:
+            if has_state:
+                # session peut-être invalide (redirection /login côté client après hydratation) :
+                # on jette l'état et on lève pour que @retry relance run() avec un login complet,
+                # plutôt que de renvoyer [] et vider la colonne Shotgun du consolidé
+                try:
+                    os.remove(state_path)
+                except OSError:
+                    pass
+                raise RuntimeError("Shotgun: 0 carte avec la session sauvegardée, nouvel essai avec login complet")
             try:
                 await page.screenshot(path="events_empty.png", full_page=True)
                 html = await page.content()
@@ -266,213 +654,25 @@ async def run() -> List[NormalizedEvent]:
                     f.write(html)
             except Exception:
                 pass
-            await context.close(); await browser.close()
             log.info("Shotgun: 0 événements parsés")
             return []
 
-        out: List[NormalizedEvent] = []
-        names_sample = []
-
-        for c in cards:
-            # --- Nom de l'événement
-            name_el = await c.query_selector("span.truncate.text-sm.font-medium")
-            if not name_el:
-                name_el = await c.query_selector("span.font-medium, h3, a[title], [class*='font-medium']")
-            event_name = (await name_el.inner_text()).strip() if name_el else None
-            if not event_name:
-                # petit filet : premier <a> “profond” avec un texte non vide
-                a = await c.query_selector("a")
-                if a:
-                    txt = (await a.inner_text()).strip()
-                    event_name = txt or None
-            if not event_name:
-                continue  # sans nom, on passe
-
-            # --- Artiste/lieu hints si présents
-            artist_el = await c.query_selector("[data-testid='artist-name'], .artist-name, .text-artist")
-            artist_hint = (await artist_el.inner_text()).strip() if artist_el else None
-
-            venue_el = await c.query_selector("[data-testid='venue-name'], .venue-name, .text-venue")
-            venue_hint = (await venue_el.inner_text()).strip() if venue_el else None
-
-            city_el = await c.query_selector("[data-testid='city-name'], .text-city, [class*='city']")
-            city = (await city_el.inner_text()).strip() if city_el else None
-
-            artist_name, venue_name = _guess_artist_and_venue(
-                event_name,
-                artist_hint=artist_hint,
-                venue_hint=venue_hint or city,
-            )
-
-            # --- Date/heure locale (bétonnée) ---
-            event_dt = None
-
-            # 1) Balise <time datetime="...">
-            t = await c.query_selector("time[datetime]")
-            if t:
-                try:
-                    iso_val = await t.get_attribute("datetime")
-                    if iso_val:
-                        event_dt = dateparser.parse(
-                            iso_val,
-                            settings={"RETURN_AS_TIMEZONE_AWARE": False}
-                        )
-                except Exception:
-                    event_dt = None
-
-            # 2) Fallback: texte voisin (petit libellé date)
-            if event_dt is None:
-                date_el = await c.query_selector(
-                    "span.text-white-700.text-xs.font-normal, "
-                    "time, [data-testid='event-date'], [class*='text-xs']"
-                )
-                dt_text = (await date_el.inner_text()).strip() if date_el else None
-                if dt_text:
-                    event_dt = dateparser.parse(
-                        dt_text,
-                        languages=["fr"],
-                        settings={
-                            "TIMEZONE": "Europe/Paris",
-                            "RETURN_AS_TIMEZONE_AWARE": False,
-                            "PREFER_DATES_FROM": "future",
-                        },
-                    )
-
-            # 3) Fallback ultime: on racle tout le texte de la carte et on cherche:
-            #    - un ISO (2025-11-29T19:00)
-            #    - ou un motif FR "ven. 10 oct. 2025 19:30" / "10 oct. 2025 19:30" / "10 octobre 2025 19:30"
-            if event_dt is None:
-                try:
-                    raw = await c.inner_text()
-                    # ISO
-                    m = re.search(r"\b(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(?::\d{2})?)", raw)
-                    if m:
-                        event_dt = dateparser.parse(
-                            m.group(1),
-                            settings={"RETURN_AS_TIMEZONE_AWARE": False}
-                        )
-                    if event_dt is None:
-                        # FR courte (avec mois abrégé) ou longue
-                        # ex: "ven. 10 oct. 2025 19:30" / "10 octobre 2025 19:30"
-                        m = re.search(
-                            r"(?:(?:lun|mar|mer|jeu|ven|sam|dim)\.?\s*)?"
-                            r"(\d{1,2}\s+[A-Za-zéûîôàç\.]+\.?\s+\d{4}(?:\s+\d{1,2}:\d{2})?)",
-                            raw, flags=re.IGNORECASE
-                        )
-                        if m:
-                            event_dt = dateparser.parse(
-                                m.group(1),
-                                languages=["fr"],
-                                settings={
-                                    "TIMEZONE": "Europe/Paris",
-                                    "RETURN_AS_TIMEZONE_AWARE": False,
-                                    "PREFER_DATES_FROM": "future",
-                                },
-                            )
-                except Exception:
-                    pass
-
-            # 4) Si on n'a toujours rien, trace courte pour debug
-            if event_dt is None:
-                try:
-                    snippet = (await c.inner_text())[:200].replace("\n", " ")
-                    log.debug("Shotgun: date introuvable pour %r ; snippet=%r", event_name, snippet)
-                except Exception:
-                    log.debug("Shotgun: date introuvable pour %r (no snippet)", event_name)
-
-
-            # --- Statistiques (€, #, %) ---
-            gross_total = None
-            tickets_total = None
-            sell_through_pct = None
+        # Parsing pur Python (plus aucun await par carte)
+        out = normalize(cards, now, run_id)
 
+        # Artefacts debug (désactivés par défaut : screenshot full page + DOM = plusieurs Mo)
+        if settings.debug_dumps:
             try:
-                # toutes les valeurs numériques
-                values = await c.query_selector_all(".ant-statistic-content .ant-statistic-content-value")
-                suffixes = await c.query_selector_all(".ant-statistic-content .ant-statistic-content-suffix")
-
-                async def _suffix_text(node):
-                    try:
-                        return (await node.inner_text()).lower().strip()
-                    except Exception:
-                        return ""
-
-                # On mappe value[i] ↔ suffix[i] si dispo
-                vals = []
-                for i, v in enumerate(values):
-                    txt = (await v.inner_text()).strip()
-                    suf = ""
-                    if i < len(suffixes):
-                        suf = await _suffix_text(suffixes[i])
-                    vals.append((txt, suf))
-
-                # on prend le premier entier sans suffixe "aujourd"
-                for txt, suf in vals:
-                    if "aujourd" in suf:
-                        continue
-                    num = _parse_int(txt)
-                    if num is not None:
-                        tickets_total = num
-                        break
-
-                # idem pour les montants €
-                for txt, suf in vals:
-                    if "€" in txt and "aujourd" not in suf:
-                        val, _ = _parse_money(txt)
-                        gross_total = val
-                        break
-
-                # % (si présent quelque part)
-                pct_el = await c.query_selector("span.text-xs.font-semibold, [class*='font-semibold']")
-                if pct_el:
-                    pct_txt = (await pct_el.inner_text()).strip()
-                    sell_through_pct = float(_parse_int(pct_txt) or 0)
-
+                with open("shotgun_cards_count.txt", "w", encoding="utf-8") as f:
+                    f.write(f"cards_detected={len(cards)} parsed={len(out)} sample={[e.event_name for e in out[:10]]}\n")
+                await page.screenshot(path="shotgun_events.png", full_page=True)
+                html = await page.content()
+                with open("shotgun_events.html", "w", encoding="utf-8") as f:
+                    f.write(html)
+                with open("shotgun_xhr.txt", "w", encoding="utf-8") as f:
+                    f.write("\n".join(xhr_seen) + "\n")
             except Exception:
                 pass
 
-            # --- Statut
-            full_text = (await c.inner_text()).upper()
-            status = "sold out" if "COMPLET" in full_text else "on sale"
-
-            # --- ID stable
-            dt_key = event_dt.isoformat() if event_dt else None
-            event_id_provider = _stable_event_id(event_name, dt_key)
-
-            out.append(NormalizedEvent(
-                provider="shotgun",
-                event_id_provider=event_id_provider,
-                event_name=event_name,
-                city=city,
-                country=None,
-                event_datetime_local=event_dt,  # NAIF local
-                timezone="Europe/Paris",
-                status=status,
-                tickets_sold_total=tickets_total,
-                gross_total=gross_total,
-                net_total=None,
-                currency="EUR",
-                sell_through_pct=sell_through_pct,
-                scrape_ts_utc=now,
-                ingestion_run_id=run_id,
-                artist_name=artist_name,
-                venue_name=venue_name or city,
-            ))
-
-            if len(names_sample) < 10:
-                names_sample.append(event_name)
-
-        # Artefacts debug légers
-        try:
-            with open("shotgun_cards_count.txt", "w", encoding="utf-8") as f:
-                f.write(f"cards_detected={len(cards)} parsed={len(out)} sample={names_sample}\n")
-            await page.screenshot(path="shotgun_events.png", full_page=True)
-            html = await page.content()
-            with open("shotgun_events.html", "w", encoding="utf-8") as f:
-                f.write(html)
-        except Exception:
-            pass
-
-        await context.close(); await browser.close()
         log.info("Shotgun: %d événements parsés", len(out))
         return out
@@ -17,21 +17,54 @@ from concerts_etl.adapters import dice as dice_adapter
 log = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-async def run_all() -> None:
-    # 1) Shotgun
+def _json_default(v: Any) -> Any:
+    # date/datetime → ISO ; appelé par json uniquement pour les types non natifs
+    if hasattr(v, "isoformat"):
+        return v.isoformat()
+    raise TypeError(f"{type(v).__name__} non sérialisable")
+
+
+def _write_preview(preview: List[Dict[str, Any]], path: str) -> None:
+    # réécrit seulement si le contenu change (mtime stable pour les diffs d'artefacts)
     try:
-        sg_events: List[NormalizedEvent] = await shotgun_adapter.run()
-    except Exception as e:
-        log.exception("Shotgun: échec run()")
-        sg_events = []
-    log.info("Shotgun: %s events", len(sg_events))
+        payload = json.dumps(preview, ensure_ascii=False, indent=2, default=_json_default)
+        try:
+            with open(path, encoding="utf-8") as f:
+                if f.read() == payload:
+                    return
+        except FileNotFoundError:
+            pass
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(payload)
+    except Exception:
+        pass
+
 
-    # 2) DICE
+async def _run_shotgun() -> List[NormalizedEvent]:
     try:
-        dc_events: List[NormalizedEvent] = await dice_adapter.run()
-    except Exception as e:
-        log.exception("Dice: échec run()")
-        dc_events = []
+        return await shotgun_adapter.run()
+    finally:
+        await shotgun_adapter.close_browser()
+
+
+async def run_all() -> None:
+    # 1) + 2) Shotgun et DICE en parallèle (I/O réseau uniquement, aucun état partagé)
+    sg_res, dc_res = await asyncio.gather(
+        _run_shotgun(), dice_adapter.run(), return_exceptions=True
+    )
+
+    sg_events: List[NormalizedEvent] = []
+    if isinstance(sg_res, BaseException):
+        log.error("Shotgun: échec run()", exc_info=sg_res)
+    else:
+        sg_events = sg_res
+    log.info("Shotgun: %s events", len(sg_events))
+
+    dc_events: List[NormalizedEvent] = []
+    if isinstance(dc_res, BaseException):
+        log.error("Dice: échec run()", exc_info=dc_res)
+    else:
+        dc_events = dc_res
     log.info("Dice: %s events", len(dc_events))
 
     # 3) Consolidation (date-only + règles de matching)
@@ -41,21 +74,18 @@ async def run_all() -> None:
     await export_to_gsheet(rows)
 
     # 5) Dump providers preview pour debug local (dates -> string)
-    try:
-        preview = []
-        for r in rows[:20]:
-            r2 = dict(r)
-            v = r2.get("event_datetime_local")
-            if hasattr(v, "isoformat"):
-                r2["event_datetime_local"] = v.isoformat()
-            preview.append(r2)
-        with open("providers_preview.json", "w", encoding="utf-8") as f:
-            json.dump(preview, f, ensure_ascii=False, indent=2)
-    except Exception:
-        pass
+    if rows:
+        _write_preview(rows[:20], "providers_preview.json")
 
 def main() -> None:
-    asyncio.run(run_all())
+    # uvloop (optionnel, POSIX) : boucle libuv si installée, sinon asyncio standard
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(run_all())
 
 if __name__ == "__main__":
     main()
@@ -2,12 +2,18 @@ import os
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
-load_dotenv()
+# En CI les variables viennent des secrets : inutile de chercher/parse un .env
+if not os.getenv("CI"):
+    load_dotenv()
 
 @dataclass(frozen=True)
 class Settings:
     shotgun_email: str = os.getenv("SHOTGUN_EMAIL", "")
     shotgun_password: str = os.getenv("SHOTGUN_PASSWORD", "")
+    # Session Playwright persistée entre deux runs (vide = désactivé)
+    shotgun_state_path: str = os.getenv("SHOTGUN_STATE_PATH", ".shotgun_state.json")
+    # Au-delà de cet âge (heures) la session sauvegardée est ignorée → login complet
+    shotgun_state_max_age_h: float = float(os.getenv("SHOTGUN_STATE_MAX_AGE_H", "12"))
 
     gsheet_id: str = os.getenv("GSHEET_ID", "")
     gsheet_doc_title: str = os.getenv("GSHEET_DOC_TITLE", "Concerts Pointages")
@@ -15,6 +21,9 @@ class Settings:
 
     export_csv_dir: str = os.getenv("EXPORT_CSV_DIR", "exports")
 
+    # Artefacts de debug (screenshot/HTML) même quand le scraping réussit
+    debug_dumps: bool = os.getenv("DEBUG_DUMPS", "").lower() in ("1", "true", "yes")
+
     smtp_host: str = os.getenv("SMTP_HOST", "")
     smtp_port: int = int(os.getenv("SMTP_PORT", "587"))
     smtp_user: str = os.getenv("SMTP_USER", "")
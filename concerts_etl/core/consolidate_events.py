@@ -2,27 +2,42 @@
 from __future__ import annotations
 
 import re
+import functools
 import unicodedata
 from datetime import datetime, date
-from typing import Any, Dict, List, Optional, Tuple, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Set
 
 from concerts_etl.core.models import NormalizedEvent
 
 # ------------------- normalisation / tokenisation -------------------
 
-_STOPWORDS = {
+_STOPWORDS = frozenset({
     "the","and","feat","ft","with","x","&","+","-","–","—",
     "le","la","les","l","de","du","des","et","au","aux","chez","a","an","on","in",
-}
+})
 
-def _strip_accents(s: str) -> str:
+_WS_RE = re.compile(r"\s+")
+_ISO_DAY_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+def _strip_combining(s: str) -> str:
     return "".join(c for c in unicodedata.normalize("NFKD", s) if not unicodedata.combining(c))
 
+# Latin-1 Supplement + Latin Extended-A : même règle NFKD/combining précalculée par caractère
+_LATIN_STRIP = str.maketrans({chr(cp): _strip_combining(chr(cp)) for cp in range(0x80, 0x180)})
+
+def _strip_accents(s: str) -> str:
+    if s.isascii():  # cas majoritaire : rien à décomposer
+        return s
+    if max(s) < "\u0180":  # texte latin FR/EN : une passe translate en C
+        return s.translate(_LATIN_STRIP)
+    return _strip_combining(s)
+
 def _norm_basic(s: Optional[str]) -> str:
     if not s:
         return ""
     s = _strip_accents(s).lower()
-    s = re.sub(r"\s+", " ", s)
+    s = _WS_RE.sub(" ", s)
     return s.strip()
 
 def _date_str(e: Optional[NormalizedEvent]) -> str:
@@ -33,31 +48,32 @@ def _date_str(e: Optional[NormalizedEvent]) -> str:
     if isinstance(v, datetime):
         return v.date().isoformat()
     if isinstance(v, str):
-        m = re.match(r"(\d{4}-\d{2}-\d{2})", v)
+        m = _ISO_DAY_RE.match(v)
         return m.group(1) if m else v
     return ""
 
+@functools.lru_cache(maxsize=8192)
+def _tokens_for_one(raw: str) -> FrozenSet[str]:
+    """Tokens d'un seul champ ; mémoïsé car les mêmes artistes reviennent d'un jour/provider à l'autre."""
+    # séparateurs (&, +, /, @, – , feat, x...) et ponctuation → espace, puis découpage en mots :
+    # feat/ft/with et "x" sont de toute façon écartés par le filtre stopwords/longueur
+    parts = _PUNCT_RE.sub(" ", _norm_basic(raw)).split()
+    return frozenset(t for t in parts if len(t) > 2 and t not in _STOPWORDS)
+
 def _artist_tokens(*fields: Optional[str]) -> Set[str]:
     tokens: Set[str] = set()
     for raw in fields:
-        if not raw:
-            continue
-        s = _norm_basic(raw)
-        s = re.sub(r"\b(feat|ft|with)\b", ",", s)
-        s = re.sub(r"\s+[xX]\s+", ",", s)
-        s = s.replace("&", ",").replace("+", ",").replace("/", ",").replace(" @ ", ",")
-        s = s.replace(" – ", ",").replace(" — ", ",").replace(" - ", ",")
-        parts: List[str] = []
-        for chunk in s.split(","):
-            chunk = re.sub(r"[^\w\s]", " ", chunk).strip()
-            if chunk:
-                parts.extend(chunk.split())
-        for t in parts:
-            if len(t) <= 2 or t in _STOPWORDS:
-                continue
-            tokens.add(t)
+        if raw:
+            tokens |= _tokens_for_one(raw)
     return tokens
 
+def _event_keys(e: NormalizedEvent) -> Tuple[str, Set[str]]:
+    """(jour 'YYYY-MM-DD', tokens d'artiste) en un seul appel ; jour vide → tokens non calculés."""
+    d = _date_str(e)
+    if not d:
+        return "", set()
+    return d, _artist_tokens(e.artist_name, e.event_name)
+
 def _sort_key(row: Dict[str, Any]) -> Tuple[str, str]:
     """Tri ascendant par date (YYYY-MM-DD)."""
     dt = row.get("event_datetime_local") or ""
@@ -75,44 +91,87 @@ def consolidate_events(
     - Si pas de date côté SG, l’event est exclu.
     - On filtre les dates passées.
     """
+    # dates passées écartées dès l'entrée : un DICE passé ne peut apparier qu'un SG du même jour (passé aussi)
+    today = date.today().isoformat()
+
+    # doublons (retries, pagination) : on garde la 1re occurrence de chaque id, avant tout calcul de clé ;
+    # id vide (DICE sans "id") → pas de dédoublonnage, sinon tous ces events fusionneraient dans le 1er
+    seen_sg: Set[str] = set()
     sg_by_day: Dict[str, List[Tuple[NormalizedEvent, Set[str]]]] = {}
     for sg in (shotgun_events or []):
-        d = _date_str(sg)
-        if not d:
-            continue  # exclut SG sans date
-        toks = _artist_tokens(getattr(sg, "artist_name", None), sg.event_name)
+        eid = sg.event_id_provider
+        if eid:
+            if eid in seen_sg:
+                continue
+            seen_sg.add(eid)
+        d, toks = _event_keys(sg)
+        if not d or d < today:
+            continue  # exclut SG sans date ou passé
         sg_by_day.setdefault(d, []).append((sg, toks))
 
-    used_sg: Set[str] = set()
-    used_dc: Set[str] = set()
+    # index inversé jour → token → positions SG : seuls les SG partageant un token sont évalués
+    sg_index_by_day: Dict[str, Dict[str, List[int]]] = {}
+    for d, lst in sg_by_day.items():
+        index: Dict[str, List[int]] = {}
+        for i, (_, toks) in enumerate(lst):
+            for t in toks:
+                index.setdefault(t, []).append(i)
+        sg_index_by_day[d] = index
+
+    # SG déjà appariés : un octet par position dans sg_by_day[jour] (ids uniques après dédoublonnage)
+    used_sg_by_day: Dict[str, bytearray] = {d: bytearray(len(lst)) for d, lst in sg_by_day.items()}
     rows: List[Dict[str, Any]] = []
 
-    # apparier DICE -> SG
+    # clés DICE calculées une seule fois (réutilisées pour les restants)
+    seen_dc: Set[str] = set()
+    dc_keyed: List[Tuple[NormalizedEvent, str, Set[str]]] = []
     for dc in (dice_events or []):
-        d = _date_str(dc)
-        if not d:
+        eid = dc.event_id_provider
+        if eid:
+            if eid in seen_dc:
+                continue
+            seen_dc.add(eid)
+        d, toks = _event_keys(dc)
+        if not d or d < today:
             continue
-        dc_toks = _artist_tokens(getattr(dc, "artist_name", None), dc.event_name)
-
-        best: Optional[Tuple[NormalizedEvent, int]] = None
+        dc_keyed.append((dc, d, toks))
 
-        for sg, sg_toks in sg_by_day.get(d, []):
-            if sg.event_id_provider in used_sg:
+    # apparier DICE -> SG
+    used_dc = bytearray(len(dc_keyed))
+    for j, (dc, d, dc_toks) in enumerate(dc_keyed):
+        day_sgs = sg_by_day.get(d)
+        if not day_sgs:
+            continue
+        index = sg_index_by_day[d]
+        used_sg = used_sg_by_day[d]
+        counts: Dict[int, int] = {}
+        for t in dc_toks:
+            for i in index.get(t, ()):
+                counts[i] = counts.get(i, 0) + 1
+
+        # ordre des positions conservé : à recouvrement égal, le premier SG du jour gagne
+        best: Optional[Tuple[int, int]] = None
+        max_overlap = len(dc_toks)
+        for i in sorted(counts):
+            if used_sg[i]:
                 continue
-            overlap = len(dc_toks & sg_toks)
-            if overlap > 0 and (best is None or overlap > best[1]):
-                best = (sg, overlap)
+            overlap = counts[i]
+            if best is None or overlap > best[1]:
+                best = (i, overlap)
+                if overlap == max_overlap:
+                    break  # tous les tokens DICE couverts : impossible de faire mieux
 
         if best:
-            sg, _ = best
-            used_sg.add(sg.event_id_provider)
-            used_dc.add(dc.event_id_provider)
+            best_i, _ = best
+            sg = day_sgs[best_i][0]
+            used_sg[best_i] = 1
+            used_dc[j] = 1
 
             event_name = sg.event_name or dc.event_name or ""
-            artist_disp = sg.artist_name or getattr(dc, "artist_name", "") or ""
+            artist_disp = sg.artist_name or dc.artist_name or ""
             venue_disp = (
-                getattr(sg, "venue_name", None)
-                or getattr(dc, "venue_name", None)
+                sg.venue_name
+                or dc.venue_name
                 or sg.city
                 or dc.city
                 or ""
@@ -131,39 +190,33 @@ def consolidate_events(
 
     # SG restants
     for d, lst in sg_by_day.items():
-        for sg, _ in lst:
-            if sg.event_id_provider in used_sg:
+        used_sg = used_sg_by_day[d]
+        for i, (sg, _) in enumerate(lst):
+            if used_sg[i]:
                 continue
             rows.append({
                 "event_name": sg.event_name or "",
                 "event_datetime_local": d,
                 "artist": sg.artist_name or "",
-                "venue": getattr(sg, "venue_name", None) or sg.city or "",
+                "venue": sg.venue_name or sg.city or "",
                 "shotgun_tickets_sold": sg.tickets_sold_total,
                 "dice_tickets_sold": None,
                 "shotgun_event_id": sg.event_id_provider,
             })
 
     # DICE restants
-    for dc in (dice_events or []):
-        if dc.event_id_provider in used_dc:
-            continue
-        d = _date_str(dc)
-        if not d:
+    for j, (dc, d, _) in enumerate(dc_keyed):
+        if used_dc[j]:
             continue
         rows.append({
             "event_name": dc.event_name or "",
             "event_datetime_local": d,
-            "artist": getattr(dc, "artist_name", "") or "",
-            "venue": getattr(dc, "venue_name", None) or dc.city or "",
+            "artist": dc.artist_name or "",
+            "venue": dc.venue_name or dc.city or "",
             "shotgun_tickets_sold": None,
             "dice_tickets_sold": dc.tickets_sold_total,
             "dice_event_id": dc.event_id_provider,
         })
 
-    # filtre dates passées
-    today = date.today().isoformat()
-    rows = [r for r in rows if r.get("event_datetime_local") and r["event_datetime_local"] >= today]
-
     rows.sort(key=_sort_key)
     return rows
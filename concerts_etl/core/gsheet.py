@@ -26,16 +26,6 @@ _BASE_HEADERS = [
 _client = None
 
 
-def _datetime_to_str(v: Any) -> Any:
-    if isinstance(v, datetime):
-        # On garde ISO sans timezone si naive, sinon isoformat complet
-        try:
-            return v.isoformat()
-        except Exception:
-            return str(v)
-    return v
-
-
 def _ensure_client():
     global _client
     if _client is not None:
@@ -86,10 +76,11 @@ def _build_headers(rows: List[Dict[str, Any]]) -> List[str]:
 
 
 def _rows_to_matrix(rows: List[Dict[str, Any]], headers: List[str]) -> List[List[Any]]:
-    out = []
-    for r in rows:
-        out.append([_datetime_to_str(r.get(h, "")) for h in headers])
-    return out
+    # datetime → ISO (sans timezone si naïf) ; test inline, sans appel de fonction par cellule
+    return [
+        [v.isoformat() if isinstance(v := r.get(h, ""), datetime) else v for h in headers]
+        for r in rows
+    ]
 
 
 async def export_to_gsheet(consolidated_rows: List[Dict[str, Any]]):
@@ -110,11 +101,9 @@ async def export_to_gsheet(consolidated_rows: List[Dict[str, Any]]):
         headers = _build_headers(consolidated_rows)
         matrix = _rows_to_matrix(consolidated_rows, headers)
 
-        # Clear + rewrite
+        # Clear + rewrite : en-têtes et données dans un seul appel values.update
         ws.clear()
-        ws.update("A1", [headers])           # en-têtes
-        if matrix:
-            ws.update(f"A2", matrix)         # données
+        ws.update("A1", [headers] + matrix, value_input_option="RAW")
 
         # Redimensionnement sommaire
         try:
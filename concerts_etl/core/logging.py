@@ -1,8 +1,23 @@
 import json, logging, sys
 from datetime import datetime, timezone
+# préfixe ISO "YYYY-MM-DDTHH:MM:SS" mis en cache par seconde : seuls les µs changent entre records rapprochés
+_last_sec = None
+_last_prefix = ""
+def _iso_utc(created):
+    global _last_sec, _last_prefix
+    sec = int(created)
+    # µs arrondis au pair le plus proche, comme datetime.fromtimestamp (retenue sur la seconde comprise)
+    us = round((created - sec) * 1_000_000)
+    if us >= 1_000_000:
+        sec += 1; us -= 1_000_000
+    if sec != _last_sec:
+        _last_sec, _last_prefix = sec, datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    if not us:  # isoformat() omet la fraction quand elle est nulle
+        return _last_prefix + "+00:00"
+    return "%s.%06d+00:00" % (_last_prefix, us)
 class JsonFormatter(logging.Formatter):
     def format(self, record):
-        p={"ts":datetime.now(timezone.utc).isoformat(),
+        p={"ts":_iso_utc(record.created),
            "level":record.levelname,"logger":record.name,"msg":record.getMessage()}
         if record.exc_info: p["exc_info"]=self.formatException(record.exc_info)
         return json.dumps(p, ensure_ascii=False)
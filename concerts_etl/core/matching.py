@@ -1,6 +1,6 @@
 from __future__ import annotations
-import re, unicodedata
-from datetime import datetime, timedelta
+import re, unicodedata, functools
+from datetime import date, datetime, timedelta
 from difflib import SequenceMatcher
 from typing import Dict, List, Tuple, Optional
 from pydantic import BaseModel
@@ -9,10 +9,19 @@ from concerts_etl.core.models import NormalizedEvent
 # ---- clé canonique & normalisation ----
 
 STOPWORDS = {"live","concert","tour"}
+_NONWORD_RE = re.compile(r"[\W_]+")
+_ASCII_NONWORD_TO_SPACE = str.maketrans({chr(c): " " for c in range(128) if not chr(c).isalnum()})
+
+# _sim compare chaque paire DICE×SG : sans cache, chaque nom serait renormalisé N·M fois
+@functools.lru_cache(maxsize=16384)
 def _norm_name(s: str) -> str:
     s = (s or "").lower()
-    s = "".join(c for c in unicodedata.normalize("NFKD", s) if not unicodedata.combining(c))
-    s = re.sub(r"[\W_]+", " ", s)
+    if s.isascii():
+        # cas courant : ni NFKD ni regex, une seule passe translate
+        s = s.translate(_ASCII_NONWORD_TO_SPACE)
+    else:
+        s = "".join(c for c in unicodedata.normalize("NFKD", s) if not unicodedata.combining(c))
+        s = _NONWORD_RE.sub(" ", s)
     tokens = [t for t in s.split() if t and t not in STOPWORDS]
     return " ".join(tokens)
 
@@ -61,20 +70,51 @@ def merge_shotgun_dice(shotgun: List[NormalizedEvent], dice: List[NormalizedEven
             ingestion_run_id=ev.ingestion_run_id,
         )
 
+    # SG regroupés par jour (positions dans l'ordre de sg_index) ; les SG sans date restent candidats partout
+    # projection (clé, datetime, nom normalisé) calculée une fois : la boucle interne ne touche plus aux modèles
+    sg_items: List[Tuple[str, Optional[datetime], str]] = [
+        (key, sv.event_datetime_local, _norm_name(sv.event_name)) for key, sv in sg_index.items()
+    ]
+    sg_by_date: Dict[date, List[int]] = {}
+    sg_undated: List[int] = []
+    for i, (_, sv_dt, _) in enumerate(sg_items):
+        if sv_dt:
+            sg_by_date.setdefault(sv_dt.date(), []).append(i)
+        else:
+            sg_undated.append(i)
+    tolerance_s = hour_tolerance_min * 60
+
     # rattacher DICE à la meilleure clé SG
     for dv in dice:
         best_key = None
         best_score = 0.0
-        for key, sv in sg_index.items():
-            # même jour
-            if sv.event_datetime_local and dv.event_datetime_local and sv.event_datetime_local.date() != dv.event_datetime_local.date():
-                continue
+        # même jour uniquement : seul le bucket du jour DICE (+ SG sans date) est parcouru
+        if dv.event_datetime_local:
+            candidates = sg_by_date.get(dv.event_datetime_local.date(), [])
+            if sg_undated:
+                candidates = sorted(candidates + sg_undated)
+        else:
+            candidates = range(len(sg_items))
+        dv_dt = dv.event_datetime_local
+        # nom DICE fixé en seq2 : SequenceMatcher ne reconstruit son index (b2j) qu'une fois par event DICE
+        sm = SequenceMatcher(None, "", _norm_name(dv.event_name))
+        for i in candidates:
+            key, sv_dt, sv_norm = sg_items[i]
             # tolérance horaire
-            if sv.event_datetime_local and dv.event_datetime_local:
-                if abs((sv.event_datetime_local - dv.event_datetime_local).total_seconds()) > hour_tolerance_min * 60:
+            if sv_dt and dv_dt:
+                if abs((sv_dt - dv_dt).total_seconds()) > tolerance_s:
                     continue
             # similarité nom
-            score = _sim(sv.event_name, dv.event_name)
+            sm.set_seq1(sv_norm)
+            # bornes supérieures exactes de ratio() (longueurs, puis multiset de caractères) :
+            # inutile de calculer le vrai ratio si elles ne battent ni le seuil ni le meilleur courant
+            ub = sm.real_quick_ratio()
+            if ub < name_threshold or ub <= best_score:
+                continue
+            ub = sm.quick_ratio()
+            if ub < name_threshold or ub <= best_score:
+                continue
+            score = sm.ratio()
             if score >= name_threshold and score > best_score:
                 best_key, best_score = key, score
 
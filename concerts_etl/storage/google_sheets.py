@@ -1,8 +1,6 @@
 import os, csv, logging
 from datetime import datetime, timezone
 from typing import Iterable, List
-import gspread
-from google.oauth2.service_account import Credentials
 from concerts_etl.core.config import settings
 from concerts_etl.core.models import NormalizedEvent
 from concerts_etl.core.matching import ConsolidatedRow
@@ -10,12 +8,35 @@ from concerts_etl.core.matching import ConsolidatedRow
 log = logging.getLogger(__name__)
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
+# en-têtes partagés Sheets/CSV (list() seulement là où gspread compare/envoie une liste)
+_HEADER_EVENTS = (
+    "provider","event_id_provider","event_name","city","country",
+    "event_datetime_local","timezone","status","tickets_sold_total",
+    "gross_total","net_total","currency","sell_through_pct",
+    "scrape_ts_utc","ingestion_run_id",
+)
+_HEADER_CONSOLIDATED = (
+    "canonical_event_key","event_name","event_datetime_local","timezone",
+    "tickets_sold_total_shotgun","tickets_sold_total_dice",
+    "scrape_ts_utc","ingestion_run_id",
+)
+
+_gc = None
+
 def _client():
+    # client mémoïsé : events + consolidé dans le même run ne relisent pas le JSON ni ne refont l'OAuth
+    global _gc
+    if _gc is not None:
+        return _gc
     creds_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
     if not creds_path or not os.path.exists(creds_path):
         raise RuntimeError("GOOGLE_APPLICATION_CREDENTIALS introuvable (fichier JSON Service Account manquant)")
+    # import paresseux : gspread/google-auth ne sont chargés que si un export Sheets a lieu (pas pour le CSV)
+    import gspread
+    from google.oauth2.service_account import Credentials
     creds = Credentials.from_service_account_file(creds_path, scopes=SCOPES)
-    return gspread.authorize(creds)
+    _gc = gspread.authorize(creds)
+    return _gc
 
 def upsert_rows(events: Iterable[NormalizedEvent]) -> str:
     """Append-only dans Google Sheets (historisation journalière)."""
@@ -23,6 +44,7 @@ def upsert_rows(events: Iterable[NormalizedEvent]) -> str:
     if not events:
         return ""
 
+    import gspread
     gc = _client()
     # Ouvrir le spreadsheet
     if settings.gsheet_id:
@@ -39,64 +61,38 @@ def upsert_rows(events: Iterable[NormalizedEvent]) -> str:
     except gspread.WorksheetNotFound:
         ws = sh.add_worksheet(settings.gsheet_worksheet, rows=2000, cols=30)
 
-    header = [
-    "provider","event_id_provider","event_name","city","country",
-    "event_datetime_local","timezone","status","tickets_sold_total",
-    "gross_total","net_total","currency","sell_through_pct",
-    "scrape_ts_utc","ingestion_run_id"
-]
+    header = list(_HEADER_EVENTS)
 
+    # même constructeur que l'export CSV : une seule passe, directement dans le corps de l'appel
+    rows: List[list] = [list(_csv_row(e)) for e in events]
 
-    existing = ws.get_all_values()
-    if not existing or existing[0] != header:
+    # seule la 1re ligne est lue pour valider l'en-tête (pas de téléchargement de toute la feuille) ;
+    # feuille à réinitialiser → en-tête + données envoyés dans le même values.append
+    if ws.row_values(1) != header:
         ws.clear()
-        ws.append_row(header)
-
-    rows: List[list] = []
-    for e in events:
-            rows.append([
-        e.provider,
-        e.event_id_provider,
-        e.event_name,
-        e.city,
-        e.country,
-        e.event_datetime_local.isoformat() if e.event_datetime_local else "",
-        e.timezone,
-        e.status,
-        e.tickets_sold_total,
-        e.gross_total,
-        e.net_total,
-        e.currency,
-        e.sell_through_pct,
-        e.scrape_ts_utc.isoformat(),
-        e.ingestion_run_id,
-    ])
-
-
-    if rows:
+        ws.append_rows([header] + rows, value_input_option="USER_ENTERED")
+    else:
         ws.append_rows(rows, value_input_option="USER_ENTERED")
     log.info("gsheets.appended", extra={"count": len(rows), "sheet": sh.id})
     return sh.id
 
+def _csv_row(e: NormalizedEvent) -> tuple:
+    dt = e.event_datetime_local
+    return (
+        e.provider, e.event_id_provider, e.event_name, e.city, e.country,
+        dt.isoformat() if dt else "",
+        e.timezone, e.status, e.tickets_sold_total,
+        e.gross_total, e.net_total, e.currency,
+        e.sell_through_pct, e.scrape_ts_utc.isoformat(), e.ingestion_run_id,
+    )
+
 def export_csv(events: Iterable[NormalizedEvent], out_dir: str) -> str:
     os.makedirs(out_dir, exist_ok=True)
     path = os.path.join(out_dir, f"shotgun_{datetime.now(timezone.utc).date()}.csv")
-    with open(path, "w", newline="", encoding="utf-8") as f:
+    with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         w = csv.writer(f)
-        w.writerow([
-            "provider","event_id_provider","event_name","city","country",
-            "event_datetime_local","timezone","status","tickets_sold_total",
-            "gross_total","net_total",
-            "currency","sell_through_pct","scrape_ts_utc","ingestion_run_id"
-        ])
-        for e in events:
-            w.writerow([
-                e.provider, e.event_id_provider, e.event_name, e.city, e.country,
-                e.event_datetime_local.isoformat() if e.event_datetime_local else "",
-                e.timezone, e.status, e.tickets_sold_total,
-                e.gross_total, e.net_total, e.currency,
-                e.sell_through_pct, e.scrape_ts_utc.isoformat(), e.ingestion_run_id
-            ])
+        w.writerow(_HEADER_EVENTS)
+        w.writerows(_csv_row(e) for e in events)
     return path
 
 def upsert_rows_consolidated(rows: Iterable[ConsolidatedRow]) -> str:
@@ -110,53 +106,30 @@ def upsert_rows_consolidated(rows: Iterable[ConsolidatedRow]) -> str:
     except Exception:
         ws = sh.add_worksheet(settings.gsheet_worksheet, rows=2000, cols=30)
 
-    header = [
-        "canonical_event_key","event_name","event_datetime_local","timezone",
-        "tickets_sold_total_shotgun","tickets_sold_total_dice",
-        "scrape_ts_utc","ingestion_run_id",
-    ]
-    existing = ws.get_all_values()
-    if not existing or existing[0] != header:
-        if existing: ws.clear()
-        ws.append_row(header)
-
-    data = []
-    for r in rows:
-        data.append([
-            r.canonical_event_key,
-            r.event_name,
-            r.event_datetime_local.isoformat() if r.event_datetime_local else "",
-            r.timezone,
-            r.tickets_sold_total_shotgun,
-            r.tickets_sold_total_dice,
-            r.scrape_ts_utc.isoformat(),
-            r.ingestion_run_id,
-        ])
-    if data:
-        ws.append_rows(data, value_input_option="USER_ENTERED")
+    header = list(_HEADER_CONSOLIDATED)
+    data = [list(_consolidated_row(r)) for r in rows]
+    if ws.row_values(1) != header:
+        ws.clear()
+        data.insert(0, header)
+    ws.append_rows(data, value_input_option="USER_ENTERED")
     return sh.id
 
+def _consolidated_row(r: ConsolidatedRow) -> tuple:
+    dt = r.event_datetime_local
+    return (
+        r.canonical_event_key, r.event_name,
+        dt.isoformat() if dt else "",
+        r.timezone, r.tickets_sold_total_shotgun, r.tickets_sold_total_dice,
+        r.scrape_ts_utc.isoformat(), r.ingestion_run_id,
+    )
+
 def export_csv_consolidated(rows: Iterable[ConsolidatedRow], out_dir: str) -> str:
     os.makedirs(out_dir, exist_ok=True)
     path = os.path.join(out_dir, f"consolidated_{datetime.now(timezone.utc).date()}.csv")
-    with open(path, "w", newline="", encoding="utf-8") as f:
+    with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         w = csv.writer(f)
-        w.writerow([
-            "canonical_event_key","event_name","event_datetime_local","timezone",
-            "tickets_sold_total_shotgun","tickets_sold_total_dice",
-            "scrape_ts_utc","ingestion_run_id",
-        ])
-        for r in rows:
-            w.writerow([
-                r.canonical_event_key,
-                r.event_name,
-                r.event_datetime_local.isoformat() if r.event_datetime_local else "",
-                r.timezone,
-                r.tickets_sold_total_shotgun,
-                r.tickets_sold_total_dice,
-                r.scrape_ts_utc.isoformat(),
-                r.ingestion_run_id,
-            ])
+        w.writerow(_HEADER_CONSOLIDATED)
+        w.writerows(_consolidated_row(r) for r in rows)
     return path
 
 